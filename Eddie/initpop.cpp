@@ -14,10 +14,13 @@ Population latin_hypercube_population(const OptimizationParameters &params, std:
 
     std::uniform_real_distribution<double> unit_dist(0.0, 1.0);
 
+    // one permutation buffer reused across all dimensions
+    std::vector<std::size_t> permutation(population_size);
+
     for (std::size_t dim = 0; dim < dimension; ++dim) {
         const double lower = dim < params.variable_lower_bounds.size() ? params.variable_lower_bounds[dim] : 0.0;
         const double upper = dim < params.variable_upper_bounds.size() ? params.variable_upper_bounds[dim] : 1.0;
-        std::vector<std::size_t> permutation(population_size);
+        const bool unit_bounds = lower == 0.0 && upper == 1.0;
         std::iota(permutation.begin(), permutation.end(), 0U);
         std::shuffle(permutation.begin(), permutation.end(), rng);
 
@@ -25,8 +28,7 @@ Population latin_hypercube_population(const OptimizationParameters &params, std:
             const double jitter = unit_dist(rng);
             const double scaled = (static_cast<double>(permutation[i]) + jitter) /
                                   static_cast<double>(population_size);
-            const double value = lower + scaled * (upper - lower);
-            population[i][dim] = value;
+            population[i][dim] = unit_bounds ? scaled : lower + scaled * (upper - lower);
         }
     }
 
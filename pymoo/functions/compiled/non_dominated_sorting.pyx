@@ -73,12 +73,8 @@ cdef vector[vector[int]] c_fast_non_dominated_sort(double[:,:] F, double epsilon
 
     # for each individual a list of all individuals that are dominated by this one
     is_dominating = vector[vector[int]](n_points)
-    for _ in range(n_points):
-        is_dominating.push_back(vector[int](n_points))
 
-    n_dominated = vector[int]()
-    for i in range(n_points):
-        n_dominated.push_back(0)
+    n_dominated = vector[int](n_points, 0)
 
     current_front = vector[int]()
 
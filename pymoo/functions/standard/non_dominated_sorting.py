@@ -3,6 +3,7 @@ Standard Python implementations of non-dominated sorting algorithms.
 """
 
 import numpy as np
+from bisect import bisect_right
 from math import floor
 import weakref
 from typing import Literal, List
@@ -38,32 +39,21 @@ def fast_non_dominated_sort(F, dominator=Dominator(), **kwargs):
     if n == 0:
         return fronts
 
-    # final rank that will be returned
-    n_ranked = 0
-    ranked = np.zeros(n, dtype=int)
+    # boolean dominance matrix, D[i, j] is true if i dominates j (only the upper triangle of M is considered)
+    upper = np.triu(np.ones((n, n), dtype=bool), k=1)
+    D = (upper & (M == 1)) | (upper & (M == -1)).T
 
-    # for each individual a list of all individuals that are dominated by this one
-    is_dominating = [[] for _ in range(n)]
+    # for each individual all individuals that are dominated by this one (stored row-wise as in a CSR matrix)
+    is_dominating = np.nonzero(D)[1].astype(np.int32)
+    indptr = np.concatenate(([0], np.cumsum(D.sum(axis=1))))
 
     # storage for the number of solutions dominated this one
-    n_dominated = np.zeros(n)
+    n_dominated = D.sum(axis=0)
 
-    current_front = []
+    current_front = np.flatnonzero(n_dominated == 0).tolist()
 
-    for i in range(n):
-        for j in range(i + 1, n):  
-            rel = M[i, j]
-            if rel == 1:
-                is_dominating[i].append(j)
-                n_dominated[j] += 1
-            elif rel == -1:
-                is_dominating[j].append(i)
-                n_dominated[i] += 1
-
-        if n_dominated[i] == 0:
-            current_front.append(i)
-            ranked[i] = 1.0
-            n_ranked += 1
+    # number of solutions already assigned to a front
+    n_ranked = len(current_front)
 
     # append the first front to the current front
     fronts.append(current_front)
@@ -75,11 +65,10 @@ def fast_non_dominated_sort(F, dominator=Dominator(), **kwargs):
         # for each individual in the current front
         for i in current_front:
             # all solutions that are dominated by this individuals
-            for j in is_dominating[i]:
+            for j in is_dominating[indptr[i]:indptr[i + 1]]:
                 n_dominated[j] -= 1
                 if n_dominated[j] == 0:
                     next_front.append(j)
-                    ranked[j] = 1.0
                     n_ranked += 1
 
         fronts.append(next_front)
@@ -91,54 +80,39 @@ def fast_non_dominated_sort(F, dominator=Dominator(), **kwargs):
 def _fast_biobjective_nondominated_sort(F):
     """
     Specialized algorithm for bi-objective problems.
-    Uses the efficient skyline/multi-criteria approach with O(N log N) complexity.
+    Sweeps the points in lexicographic order and assigns each one to the first front whose
+    last member does not dominate it, which results in O(N log N) complexity.
     """
     n_points = F.shape[0]
-    
+
     if n_points == 0:
         return []
-    
-    # Sort by first objective ascending
-    sorted_indices = np.argsort(F[:, 0])
-    sorted_F = F[sorted_indices]
-    
+
+    # sort by the first and then by the second objective ascending
+    I = np.lexsort((F[:, 1], F[:, 0]))
+
     fronts = []
-    assigned = [False] * n_points
-    n_assigned = 0
-    
-    while n_assigned < n_points:
-        current_front = []
-        current_indices = []
-        
-        # Track the minimum second objective seen in the current front
-        min_second_obj = float('inf')
-        
-        for i in range(n_points):
-            if assigned[i]:
-                continue
-                
-            # Check if current point is dominated by any point in current front  
-            is_dominated = False
-            if current_indices:  # If there are already points in the current front
-                # Since points are sorted by first objective, we only need to check 
-                # if its second objective is greater than the minimum second objective in front
-                if sorted_F[i, 1] >= min_second_obj:
-                    is_dominated = True
-            
-            if not is_dominated:
-                # Add this point to the current front
-                current_front.append(sorted_indices[i])
-                current_indices.append(i)
-                assigned[i] = True
-                n_assigned += 1
-                # Update the minimum second objective
-                min_second_obj = min(min_second_obj, sorted_F[i, 1])
-        
-        if current_front:
-            fronts.append(current_front)
-        else:
-            break
-    
+
+    # the second objective of the last member of each front (non-decreasing over the fronts)
+    tails = []
+
+    for i in I:
+        f1, f2 = F[i, 0], F[i, 1]
+
+        # the first front whose last member is worse in the second objective
+        k = bisect_right(tails, f2)
+
+        # duplicates do not dominate each other and thus end up in the same front
+        if k > 0 and tails[k - 1] == f2 and F[fronts[k - 1][-1], 0] == f1:
+            k -= 1
+
+        if k == len(fronts):
+            fronts.append([])
+            tails.append(f2)
+
+        fronts[k].append(i)
+        tails[k] = f2
+
     return fronts
 
 def find_non_dominated(F, epsilon=0.0):
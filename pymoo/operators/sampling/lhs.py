@@ -36,7 +36,13 @@ def sampling_lhs(n_samples, n_var, xl=0, xu=1, smooth=True, criterion=criterion_
             if _score > score:
                 X, score = _X, _score
 
-    return xl + X * (xu - xl)
+    # samples in the unit hypercube do not need to be scaled
+    if np.all(xl == 0) and np.all(xu == 1):
+        return X
+
+    X *= xu - xl
+    X += xl
+    return X
 
 
 @default_random_state
@@ -88,10 +88,8 @@ class ZDT4(ZDT):
 
     def _evaluate(self, x, out, *args, **kwargs):
         f1 = x[:, 0]
-        g = 1.0
-        g += 10 * (self.n_var - 1)
-        for i in range(1, self.n_var):
-            g += x[:, i] * x[:, i] - 10.0 * anp.cos(4.0 * anp.pi * x[:, i])
+        x2 = x[:, 1:]
+        g = 1.0 + 10 * (self.n_var - 1) + anp.sum(x2 * x2 - 10.0 * anp.cos(4.0 * anp.pi * x2), axis=1)
         h = 1.0 - anp.sqrt(f1 / g)
         f2 = g * h
 
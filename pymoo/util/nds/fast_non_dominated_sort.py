@@ -17,33 +17,21 @@ def fast_non_dominated_sort(F, dominator=Dominator(), **kwargs):
     if n == 0:
         return fronts
 
-    # final rank that will be returned
-    n_ranked = 0
-    ranked = np.zeros(n, dtype=int)
+    # boolean dominance matrix, D[i, j] is true if i dominates j (only the upper triangle of M is considered)
+    upper = np.triu(np.ones((n, n), dtype=bool), k=1)
+    D = (upper & (M == 1)) | (upper & (M == -1)).T
 
-    # for each individual a list of all individuals that are dominated by this one
-    is_dominating = [[] for _ in range(n)]
+    # for each individual all individuals that are dominated by this one (stored row-wise as in a CSR matrix)
+    is_dominating = np.nonzero(D)[1].astype(np.int32)
+    indptr = np.concatenate(([0], np.cumsum(D.sum(axis=1))))
 
     # storage for the number of solutions dominated this one
-    n_dominated = np.zeros(n)
+    n_dominated = D.sum(axis=0)
 
-    current_front = []
+    current_front = np.flatnonzero(n_dominated == 0).tolist()
 
-    for i in range(n):
-
-        for j in range(i + 1, n):
-            rel = M[i, j]
-            if rel == 1:
-                is_dominating[i].append(j)
-                n_dominated[j] += 1
-            elif rel == -1:
-                is_dominating[j].append(i)
-                n_dominated[i] += 1
-
-        if n_dominated[i] == 0:
-            current_front.append(i)
-            ranked[i] = 1.0
-            n_ranked += 1
+    # number of solutions already assigned to a front
+    n_ranked = len(current_front)
 
     # append the first front to the current front
     fronts.append(current_front)
@@ -57,11 +45,10 @@ def fast_non_dominated_sort(F, dominator=Dominator(), **kwargs):
         for i in current_front:
 
             # all solutions that are dominated by this individuals
-            for j in is_dominating[i]:
+            for j in is_dominating[indptr[i]:indptr[i + 1]]:
                 n_dominated[j] -= 1
                 if n_dominated[j] == 0:
                     next_front.append(j)
-                    ranked[j] = 1.0
                     n_ranked += 1
 
         fronts.append(next_front)
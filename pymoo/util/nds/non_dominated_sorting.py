@@ -76,8 +76,8 @@ class NonDominatedSorting:
 def rank_from_fronts(fronts, n):
     # create the rank array and set values
     rank = np.full(n, sys.maxsize, dtype=int)
-    for i, front in enumerate(fronts):
-        rank[front] = i
+    if len(fronts) > 0:
+        rank[np.concatenate(fronts)] = np.repeat(np.arange(len(fronts)), [len(front) for front in fronts])
 
     return rank
 
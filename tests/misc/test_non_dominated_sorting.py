@@ -24,6 +24,13 @@ def test_fast_non_dominated_sorting():
     assert_fronts_equal(fronts, _fronts)
 
 
+def test_fast_non_dominated_sorting_biobjective_with_duplicates():
+    F = np.random.randint(0, 5, size=(200, 2)).astype(float)
+    fronts = load_function("fast_non_dominated_sort", _type="python")(F)
+    _fronts = load_function("fast_non_dominated_sort", _type="cython")(F)
+    assert_fronts_equal(fronts, _fronts)
+
+
 def test_efficient_non_dominated_sort():
     print("Testing ENS...")
     F = np.ones((1000, 3))